@@ -1,28 +1,85 @@
 # src/discordia/__init__.py
 from __future__ import annotations
 
-"""Discordia - Discord bot framework."""
-
-from discordia.bot import Bot
-from discordia.config import BotConfig
-from discordia.context import MessageContext
-from discordia.discovery import DiscoveryEngine
-from discordia.exceptions import (
-    ConfigurationError,
-    DiscordAPIError,
-    DiscordiaError,
-    EntityNotFoundError,
-    StateError,
-    ValidationError,
-)
-from discordia.handlers import EchoConfig, EchoHandler, Handler, LoggingConfig, LoggingHandler
-from discordia.plugins import Plugin
-from discordia.registry import EntityRegistry
-from discordia.state import Category, Channel, MemoryState, Message, StateEntity, StateStore, User
-from discordia.types import ChannelName, DiscordID, DiscordToken, MessageContent, Username
+"""Discordia - Discord bot framework.
+
+Public names are resolved lazily on first attribute access so importing a
+light submodule (e.g. ``discordia.exceptions``) does not pull in the Discord
+client through :mod:`discordia.bot` and :mod:`discordia.discovery`.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from discordia.bot import Bot
+    from discordia.config import BotConfig, get_config
+    from discordia.context import MessageContext
+    from discordia.discovery import DiscoveryEngine
+    from discordia.exceptions import (
+        ConfigurationError,
+        DiscordAPIError,
+        DiscordiaError,
+        EntityNotFoundError,
+        StateError,
+        ValidationError,
+    )
+    from discordia.handlers import EchoConfig, EchoHandler, Handler, LoggingConfig, LoggingHandler
+    from discordia.plugins import Plugin
+    from discordia.registry import EntityRegistry
+    from discordia.state import Category, Channel, MemoryState, Message, StateEntity, StateStore, User
+    from discordia.types import ChannelName, DiscordID, DiscordToken, MessageContent, Username
 
 __version__ = "0.5.0"
 
+_EXPORTS: dict[str, str] = {
+    "Bot": "discordia.bot",
+    "BotConfig": "discordia.config",
+    "get_config": "discordia.config",
+    "MessageContext": "discordia.context",
+    "DiscoveryEngine": "discordia.discovery",
+    "DiscordiaError": "discordia.exceptions",
+    "ConfigurationError": "discordia.exceptions",
+    "StateError": "discordia.exceptions",
+    "DiscordAPIError": "discordia.exceptions",
+    "EntityNotFoundError": "discordia.exceptions",
+    "ValidationError": "discordia.exceptions",
+    "Handler": "discordia.handlers",
+    "LoggingHandler": "discordia.handlers",
+    "LoggingConfig": "discordia.handlers",
+    "EchoHandler": "discordia.handlers",
+    "EchoConfig": "discordia.handlers",
+    "Plugin": "discordia.plugins",
+    "EntityRegistry": "discordia.registry",
+    "StateEntity": "discordia.state",
+    "Category": "discordia.state",
+    "Channel": "discordia.state",
+    "User": "discordia.state",
+    "Message": "discordia.state",
+    "StateStore": "discordia.state",
+    "MemoryState": "discordia.state",
+    "DiscordID": "discordia.types",
+    "ChannelName": "discordia.types",
+    "Username": "discordia.types",
+    "MessageContent": "discordia.types",
+    "DiscordToken": "discordia.types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    # Cache on the package so later lookups bypass __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
+
+
 __all__ = [
     "Bot",
     "DiscordiaError",
@@ -33,6 +90,7 @@ __all__ = [
     "ValidationError",
     "MessageContext",
     "BotConfig",
+    "get_config",
     "DiscoveryEngine",
     "EntityRegistry",
     "Plugin",
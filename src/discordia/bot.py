@@ -283,6 +283,25 @@ class Bot:
         except Exception as exc:
             logger.exception("Error processing message: %s", exc)
 
+    async def _ensure_bot_user(self) -> int | None:
+        """Record the bot's own user the first time it replies and return its ID."""
+
+        bot_user_raw = getattr(self.client, "user", None)
+        bot_id = int(getattr(bot_user_raw, "id", 0) or 0)
+        if bot_id <= 0:
+            return None
+
+        # The bot user is effectively static; skip re-validating it on every reply.
+        if bot_id not in self.state.users:
+            await self.state.save_user(
+                User(
+                    id=bot_id,
+                    username=_safe_username(getattr(bot_user_raw, "username", "bot")),
+                    bot=True,
+                )
+            )
+        return bot_id
+
     async def _reply_and_record(self, raw_message: Any, channel_id: int, response: str) -> None:
         reply_fn = getattr(raw_message, "reply", None)
         if not callable(reply_fn):
@@ -290,19 +309,10 @@ class Bot:
 
         reply_result: Any = await reply_fn(response)
 
-        bot_user_raw = getattr(self.client, "user", None)
-        bot_id = int(getattr(bot_user_raw, "id", 0) or 0)
-        if bot_id <= 0:
+        bot_id = await self._ensure_bot_user()
+        if bot_id is None:
             return
 
-        await self.state.save_user(
-            User(
-                id=bot_id,
-                username=_safe_username(getattr(bot_user_raw, "username", "bot")),
-                bot=True,
-            )
-        )
-
         reply_id = int(getattr(reply_result, "id", 0) or 0)
         if reply_id <= 0:
             reply_id = int(getattr(raw_message, "id", 0) or 0) + 1
@@ -6,6 +6,7 @@ from __future__ import annotations
 This module contains immutable configuration models used to initialize a bot.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Self
 
@@ -61,6 +62,20 @@ class BotConfig(BaseSettings):
         return cls(_env_file=str(env_file))
 
 
+@lru_cache(maxsize=1)
+def get_config() -> BotConfig:
+    """Return the process-wide configuration, loading it on first use.
+
+    Loads from the environment and ``.env`` like :meth:`BotConfig.from_env`.
+    ``BotConfig`` is frozen, so one validated instance can be shared. Call
+    ``get_config.cache_clear()`` after changing the environment to reload; use
+    :meth:`BotConfig.from_env` directly for a different ``.env`` file.
+    """
+
+    return BotConfig.from_env()
+
+
 __all__ = [
     "BotConfig",
+    "get_config",
 ]
@@ -3,10 +3,14 @@ from __future__ import annotations
 
 """Message context passed to handlers."""
 
+import time
+from collections.abc import Hashable
 from datetime import UTC, datetime
-from typing import Any
+from functools import lru_cache
+from typing import Annotated, Any, cast
 
-from pydantic import BaseModel, ConfigDict, computed_field, model_validator
+from pydantic import BaseModel, ConfigDict, PlainValidator, computed_field, model_validator
+from pydantic_core import PydanticCustomError
 
 from discordia.state import Channel, Message, StateStore, User
 from discordia.types import DiscordID
@@ -18,16 +22,37 @@ def _ensure_utc(value: datetime) -> datetime:
     return value.astimezone(UTC)
 
 
+@lru_cache(maxsize=32)
+def _is_store_class(cls: type[object]) -> bool:
+    # A check against a runtime_checkable Protocol re-inspects every member on
+    # each call. Stores are long-lived, so the class-level answer is cached.
+    return issubclass(cls, StateStore)
+
+
+def _validate_store(value: object) -> StateStore:
+    # The class check misses members set on the instance (e.g. mocks), so a
+    # negative result falls back to the full instance check. The cast only
+    # satisfies mypy, which does not treat type objects as Hashable.
+    value_type = cast(Hashable, type(value))
+    if not (_is_store_class(value_type) or isinstance(value, StateStore)):
+        raise PydanticCustomError(
+            "is_instance_of",
+            "Input should be an instance of {class}",
+            {"class": StateStore.__name__},
+        )
+    return cast(StateStore, value)
+
+
 class MessageContext(BaseModel):
     """Rich context for a received message."""
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
 
     message_id: DiscordID
     content: str
     author: User
     channel: Channel
-    store: StateStore
+    store: Annotated[StateStore, PlainValidator(_validate_store)]
     timestamp: datetime
 
     @model_validator(mode="before")
@@ -74,8 +99,7 @@ class MessageContext(BaseModel):
     def age_ms(self) -> int:
         """Message age in milliseconds."""
 
-        now = datetime.now(UTC)
-        return int((now - self.timestamp).total_seconds() * 1000)
+        return int((time.time() - self.timestamp.timestamp()) * 1000)
 
     @computed_field
     @property
@@ -5,7 +5,8 @@ from __future__ import annotations
 
 The state store protocol currently provides point lookups by ID, but not list
 or query operations. For the built-in in-memory store, the registry provides a
-thin convenience layer for common queries.
+thin convenience layer for common queries, answered from the name and category
+indexes that :class:`~discordia.state.MemoryState` maintains on save.
 """
 
 from discordia.exceptions import EntityNotFoundError
@@ -23,28 +24,25 @@ class EntityRegistry:
         """Find a category by its name within a server."""
 
         if isinstance(self._store, MemoryState):
-            async with self._store._lock:
-                for category in self._store.categories.values():
-                    if category.server_id == server_id and category.name == name:
-                        return category
+            category = await self._store.get_category_by_name(name, server_id)
+            if category is not None:
+                return category
         raise EntityNotFoundError(f"Category '{name}' not found")
 
     async def get_channel_by_name(self, name: str, server_id: DiscordID) -> Channel:
         """Find a channel by its name within a server."""
 
         if isinstance(self._store, MemoryState):
-            async with self._store._lock:
-                for channel in self._store.channels.values():
-                    if channel.server_id == server_id and channel.name == name:
-                        return channel
+            channel = await self._store.get_channel_by_name(name, server_id)
+            if channel is not None:
+                return channel
         raise EntityNotFoundError(f"Channel '{name}' not found")
 
     async def get_channels_in_category(self, category_id: DiscordID) -> list[Channel]:
         """Return all channels in a category."""
 
         if isinstance(self._store, MemoryState):
-            async with self._store._lock:
-                return [channel for channel in self._store.channels.values() if channel.category_id == category_id]
+            return await self._store.get_channels_in_category(category_id)
         return []
 
 
@@ -3,7 +3,10 @@ from __future__ import annotations
 
 """State models and storage protocol."""
 
-import asyncio
+import time
+from bisect import bisect_left, insort
+from collections import defaultdict
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any, Protocol, Self, TypeVar, runtime_checkable
 
@@ -115,7 +118,8 @@ class Message(StateEntity):
     @computed_field
     @property
     def age_seconds(self) -> float:
-        return (utc_now() - self.timestamp).total_seconds()
+        # Float epoch arithmetic avoids building an aware datetime and timedelta.
+        return time.time() - self.timestamp.timestamp()
 
     @computed_field
     @property
@@ -154,60 +158,160 @@ class StateStore(Protocol):
     async def get_messages(self, channel_id: DiscordID, limit: int = 20) -> list[Message]: ...
 
 
+def _message_order(message: Message) -> tuple[datetime, DiscordID]:
+    return message.timestamp, message.id
+
+
+def _unindex(index: dict[Any, dict[DiscordID, None]], key: Any, id: DiscordID) -> None:
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    bucket.pop(id, None)
+    if not bucket:
+        del index[key]
+
+
 class MemoryState:
-    """In-memory state storage."""
+    """In-memory state storage.
+
+    No method awaits between reading and writing its dicts, so every call is
+    atomic on the event loop and no lock is needed. Instances are not safe to
+    share across threads or event loops.
+    """
 
     def __init__(self):
         self.categories: dict[DiscordID, Category] = {}
         self.channels: dict[DiscordID, Channel] = {}
         self.users: dict[DiscordID, User] = {}
         self.messages: dict[DiscordID, Message] = {}
-        self._lock = asyncio.Lock()
+        # Secondary indexes for name and category lookups. Values are
+        # insertion-ordered dicts used as ordered sets of entity IDs; reads use
+        # .get() so lookups of unknown keys do not create buckets.
+        self._category_names: defaultdict[tuple[DiscordID, str], dict[DiscordID, None]] = defaultdict(dict)
+        self._channel_names: defaultdict[tuple[DiscordID, str], dict[DiscordID, None]] = defaultdict(dict)
+        self._category_channels: defaultdict[DiscordID, dict[DiscordID, None]] = defaultdict(dict)
+        # Index keys as recorded at save time. Callers may mutate a stored model
+        # in place before saving it again, so the old keys cannot be re-read
+        # from the previous instance.
+        self._category_keys: dict[DiscordID, tuple[DiscordID, str]] = {}
+        self._channel_keys: dict[DiscordID, tuple[tuple[DiscordID, str], DiscordID | None]] = {}
+        # Per-channel (timestamp, id) keys kept sorted so history reads slice the
+        # tail instead of filtering and sorting every message. Keys are recorded
+        # per message at save time, so a message mutated in place is still
+        # found and removed under the key it was stored with.
+        self._channel_messages: defaultdict[DiscordID, list[tuple[datetime, DiscordID]]] = defaultdict(list)
+        self._message_keys: dict[DiscordID, tuple[DiscordID, tuple[datetime, DiscordID]]] = {}
 
     async def save_category(self, category: Category) -> None:
-        async with self._lock:
-            self.categories[category.id] = category
+        old_key = self._category_keys.get(category.id)
+        if old_key is not None:
+            _unindex(self._category_names, old_key, category.id)
+        key = (category.server_id, category.name)
+        self.categories[category.id] = category
+        self._category_keys[category.id] = key
+        self._category_names[key][category.id] = None
 
     async def save_channel(self, channel: Channel) -> None:
-        async with self._lock:
-            if channel.category_id and channel.category_id not in self.categories:
-                raise StateError(f"Category {channel.category_id} not found")
-            self.channels[channel.id] = channel
+        if channel.category_id and channel.category_id not in self.categories:
+            raise StateError(f"Category {channel.category_id} not found")
+        old_keys = self._channel_keys.get(channel.id)
+        if old_keys is not None:
+            old_name_key, old_category_id = old_keys
+            _unindex(self._channel_names, old_name_key, channel.id)
+            if old_category_id is not None:
+                _unindex(self._category_channels, old_category_id, channel.id)
+        name_key = (channel.server_id, channel.name)
+        self.channels[channel.id] = channel
+        self._channel_keys[channel.id] = (name_key, channel.category_id)
+        self._channel_names[name_key][channel.id] = None
+        if channel.category_id is not None:
+            self._category_channels[channel.category_id][channel.id] = None
 
     async def save_user(self, user: User) -> None:
-        async with self._lock:
-            self.users[user.id] = user
+        self.users[user.id] = user
 
     async def save_message(self, message: Message) -> None:
-        async with self._lock:
-            if message.author_id not in self.users:
-                raise StateError(f"User {message.author_id} not found")
-            if message.channel_id not in self.channels:
-                raise StateError(f"Channel {message.channel_id} not found")
+        if message.author_id not in self.users:
+            raise StateError(f"User {message.author_id} not found")
+        if message.channel_id not in self.channels:
+            raise StateError(f"Channel {message.channel_id} not found")
+        self._unindex_message(message.id)
+        key = _message_order(message)
+        self.messages[message.id] = message
+        self._message_keys[message.id] = (message.channel_id, key)
+        insort(self._channel_messages[message.channel_id], key)
+
+    async def save_messages(self, messages: Iterable[Message]) -> None:
+        """Save a batch of messages.
+
+        Authors and channels are checked once per distinct ID before anything is
+        written, so a failing batch leaves the store unchanged. Each touched
+        channel history is re-sorted once rather than per message.
+        """
+
+        batch = {message.id: message for message in messages}
+        for author_id in dict.fromkeys(m.author_id for m in batch.values()):
+            if author_id not in self.users:
+                raise StateError(f"User {author_id} not found")
+        for channel_id in dict.fromkeys(m.channel_id for m in batch.values()):
+            if channel_id not in self.channels:
+                raise StateError(f"Channel {channel_id} not found")
+
+        # Drop replaced entries while the histories are still sorted.
+        for message_id in batch:
+            self._unindex_message(message_id)
+
+        touched: set[DiscordID] = set()
+        for message in batch.values():
+            key = _message_order(message)
             self.messages[message.id] = message
+            self._message_keys[message.id] = (message.channel_id, key)
+            self._channel_messages[message.channel_id].append(key)
+            touched.add(message.channel_id)
+        for channel_id in touched:
+            self._channel_messages[channel_id].sort()
 
     async def get_category(self, id: DiscordID) -> Category | None:
-        async with self._lock:
-            return self.categories.get(id)
+        return self.categories.get(id)
 
     async def get_channel(self, id: DiscordID) -> Channel | None:
-        async with self._lock:
-            return self.channels.get(id)
+        return self.channels.get(id)
 
     async def get_user(self, id: DiscordID) -> User | None:
-        async with self._lock:
-            return self.users.get(id)
+        return self.users.get(id)
+
+    async def get_category_by_name(self, name: str, server_id: DiscordID) -> Category | None:
+        """Return the first saved category with this name in a server."""
+
+        ids = self._category_names.get((server_id, name))
+        return self.categories[next(iter(ids))] if ids else None
+
+    async def get_channel_by_name(self, name: str, server_id: DiscordID) -> Channel | None:
+        """Return the first saved channel with this name in a server."""
+
+        ids = self._channel_names.get((server_id, name))
+        return self.channels[next(iter(ids))] if ids else None
+
+    async def get_channels_in_category(self, category_id: DiscordID) -> list[Channel]:
+        """Return the channels in a category, in save order."""
+
+        return [self.channels[channel_id] for channel_id in self._category_channels.get(category_id, ())]
 
     async def get_message(self, id: DiscordID) -> Message | None:
-        async with self._lock:
-            return self.messages.get(id)
+        return self.messages.get(id)
 
     async def get_messages(self, channel_id: DiscordID, limit: int = 20) -> list[Message]:
-        async with self._lock:
-            messages = [m for m in self.messages.values() if m.channel_id == channel_id]
-
-        sorted_msgs = sorted(messages, key=lambda m: (m.timestamp, m.id))
-        return sorted_msgs[-limit:] if limit > 0 else sorted_msgs
+        history = self._channel_messages.get(channel_id, [])
+        keys = history[-limit:] if limit > 0 else history
+        return [self.messages[message_id] for _, message_id in keys]
+
+    def _unindex_message(self, message_id: DiscordID) -> None:
+        recorded = self._message_keys.pop(message_id, None)
+        if recorded is None:
+            return
+        channel_id, key = recorded
+        history = self._channel_messages[channel_id]
+        del history[bisect_left(history, key)]
 
 
 __all__ = [
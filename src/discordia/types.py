@@ -3,10 +3,14 @@ from __future__ import annotations
 
 """Type aliases with Pydantic validators."""
 
+import re
 from typing import Annotated
 
 from pydantic import AfterValidator, SecretStr
 
+# Alphanumeric, hyphens, underscores, and spaces (for threads).
+_CHANNEL_NAME_RE = re.compile(r"[A-Za-z0-9_\- ]+")
+
 
 def validate_discord_id(v: int) -> int:
     """Validate Discord snowflake ID."""
@@ -26,9 +30,7 @@ def validate_channel_name(v: str) -> str:
     if len(v) > 100:
         raise ValueError("Channel name max 100 characters")
 
-    # Allow alphanumeric, hyphens, underscores, and spaces (for threads)
-    allowed = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_ ")
-    if not all(c in allowed for c in v):
+    if not _CHANNEL_NAME_RE.fullmatch(v):
         raise ValueError("Channel name must be alphanumeric with -, _, or spaces")
 
     return v
@@ -1,8 +1,23 @@
 # tests/conftest.py
 from __future__ import annotations
 
+import asyncio
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from dummies import FIXED_NOW, ContextFactory
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
+
+if TYPE_CHECKING:
+    from discordia.config import BotConfig
+    from discordia.context import MessageContext
 
 
 def pytest_configure() -> None:
@@ -12,3 +27,44 @@ def pytest_configure() -> None:
     src_path = project_root / "src"
     if src_path.exists() and str(src_path) not in sys.path:
         sys.path.insert(0, str(src_path))
+
+
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run the shared test event loop on uvloop when it is installed."""
+
+    if uvloop is not None:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def bot_config() -> BotConfig:
+    """Bot configuration shared across the session; BotConfig is frozen."""
+
+    from pydantic import SecretStr
+
+    from discordia.config import BotConfig
+
+    return BotConfig(discord_token=SecretStr("test"), server_id=123456789)
+
+
+@pytest.fixture(scope="module")
+def make_ctx() -> ContextFactory:
+    """Build contexts that share one store, author, and channel unless overridden."""
+
+    from discordia.context import MessageContext
+    from discordia.state import Channel, MemoryState, User
+
+    defaults: dict[str, Any] = {
+        "author": User(id=111, username="Alice"),
+        "channel": Channel(id=789, name="general", server_id=456),
+        "store": MemoryState(),
+    }
+
+    def _make(content: str, **kwargs: Any) -> MessageContext:
+        kwargs.setdefault("timestamp", FIXED_NOW)
+        return MessageContext(message_id=999, content=content, **(defaults | kwargs))
+
+    return _make
@@ -0,0 +1,62 @@
+# tests/dummies.py
+from __future__ import annotations
+
+"""Lightweight Discord client stand-ins and shared values for test modules."""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from discordia.context import MessageContext
+
+# Fixed timestamp for test data so runs are reproducible.
+FIXED_NOW = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+
+# Signature of the ``make_ctx`` fixture: ``make_ctx(content, **overrides)``.
+ContextFactory = Callable[..., "MessageContext"]
+
+
+@dataclass(slots=True)
+class DummyUser:
+    id: int
+    username: str
+    bot: bool = False
+
+
+BOT_USER = DummyUser(id=999, username="Bot", bot=True)
+
+
+@dataclass(slots=True)
+class DummyGuild:
+    channels: list[Any] = field(default_factory=list)
+
+
+class DummyClient:
+    __slots__ = ("user", "listeners", "fetch_guild_impl")
+
+    def __init__(self, user: Any, fetch_guild_impl: Callable[[int], Any] | None = None) -> None:
+        self.user = user
+        self.listeners: list[Any] = []
+        self.fetch_guild_impl = fetch_guild_impl
+
+    def add_listener(self, listener: Any) -> None:
+        self.listeners.append(listener)
+
+    async def fetch_guild(self, guild_id: int) -> Any:
+        if not self.fetch_guild_impl:
+            raise RuntimeError("fetch_guild not configured")
+        return self.fetch_guild_impl(guild_id)
+
+    def start(self) -> None:  # pragma: no cover
+        raise RuntimeError("Dummy client cannot start")
+
+    async def stop(self) -> None:  # pragma: no cover
+        return None
+
+
+def make_client(fetch_guild_impl: Callable[[int], Any] | None = None) -> DummyClient:
+    """Create a client logged in as the shared :data:`BOT_USER`."""
+
+    return DummyClient(user=BOT_USER, fetch_guild_impl=fetch_guild_impl)
@@ -2,25 +2,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
-from typing import Any, Callable
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
 
-import pytest
-from pydantic import SecretStr
+from dummies import BOT_USER, FIXED_NOW, DummyGuild, DummyUser, make_client
 
 from discordia.bot import Bot
 from discordia.config import BotConfig
-from discordia.handlers import EchoConfig, EchoHandler
+from discordia.handlers import EchoConfig, EchoHandler, LoggingHandler
 
 
-@dataclass
-class DummyUser:
-    id: int
-    username: str
-    bot: bool = False
-
-
-@dataclass
+@dataclass(slots=True)
 class DummyChannel:
     id: int
     name: str
@@ -28,13 +22,13 @@ class DummyChannel:
     topic: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DummyMessage:
     id: int
     content: str
     author: DummyUser
     channel: DummyChannel
-    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = FIXED_NOW
     reply_calls: list[str] = field(default_factory=list)
     reply_return: Any = None
 
@@ -44,110 +38,73 @@ class DummyMessage:
             self.reply_return = DummyMessage(
                 id=self.id + 1000,
                 content=content,
-                author=DummyUser(id=999, username="Bot", bot=True),
+                author=BOT_USER,
                 channel=self.channel,
             )
         return self.reply_return
 
 
-@dataclass
+@dataclass(slots=True)
 class DummyMessageCreateEvent:
     message: DummyMessage
 
 
-@dataclass
+@dataclass(slots=True)
 class DummyReadyEvent:
     user: DummyUser
 
 
-@dataclass
-class DummyClient:
-    user: DummyUser
-    listeners: list[Any] = field(default_factory=list)
-    fetch_guild_impl: Callable[[int], Any] | None = None
-
-    def add_listener(self, listener: Any) -> None:
-        self.listeners.append(listener)
-
-    async def fetch_guild(self, guild_id: int) -> Any:
-        if not self.fetch_guild_impl:
-            raise RuntimeError("fetch_guild not configured")
-        return self.fetch_guild_impl(guild_id)
-
-    def start(self) -> None:  # pragma: no cover
-        raise RuntimeError("Dummy client cannot start")
-
-    async def stop(self) -> None:  # pragma: no cover
-        return None
-
-
 class _PluginProbe:
-    def __init__(self) -> None:
-        self.ready_calls = 0
-        self.message_calls = 0
+    __slots__ = ("on_ready", "on_message")
 
-    async def on_ready(self, bot: Any, guild: Any) -> None:
-        self.ready_calls += 1
-
-    async def on_message(self, bot: Any, ctx: Any) -> None:
-        self.message_calls += 1
-
-
-def _config() -> BotConfig:
-    return BotConfig(discord_token=SecretStr("test"), server_id=123456789)
+    def __init__(self) -> None:
+        self.on_ready = AsyncMock()
+        self.on_message = AsyncMock()
 
 
-def test_bot_initialization_registers_listeners() -> None:
-    client = DummyClient(user=DummyUser(id=999, username="Bot", bot=True))
-    bot = Bot(config=_config(), client=client)
+def test_bot_initialization_registers_listeners(bot_config: BotConfig) -> None:
+    client = make_client()
+    bot = Bot(config=bot_config, client=client)
 
     assert bot.config.server_id == 123456789
     assert bot.client is client
     assert len(client.listeners) == 2
 
 
-@pytest.mark.asyncio
-async def test_bot_on_ready_discovers_and_calls_plugins() -> None:
+async def test_bot_on_ready_discovers_and_calls_plugins(bot_config: BotConfig) -> None:
     plugin = _PluginProbe()
 
-    guild = type("Guild", (), {"channels": []})()
-    client = DummyClient(
-        user=DummyUser(id=999, username="Bot", bot=True),
-        fetch_guild_impl=lambda guild_id: guild,
-    )
-    bot = Bot(config=_config(), client=client, plugins=[plugin])
+    guild = DummyGuild()
+    client = make_client(fetch_guild_impl=lambda guild_id: guild)
+    bot = Bot(config=bot_config, client=client, plugins=[plugin])
 
     await bot._on_ready(DummyReadyEvent(user=client.user))
 
-    assert plugin.ready_calls == 1
+    plugin.on_ready.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_bot_ignores_bot_messages() -> None:
+async def test_bot_ignores_bot_messages(bot_config: BotConfig) -> None:
     plugin = _PluginProbe()
-    client = DummyClient(user=DummyUser(id=999, username="Bot", bot=True))
-    bot = Bot(config=_config(), client=client, plugins=[plugin])
+    client = make_client()
+    bot = Bot(config=bot_config, client=client, plugins=[plugin])
 
-    message = DummyMessage(
-        id=1,
-        content="echo: hello",
-        author=DummyUser(id=2, username="OtherBot", bot=True),
-        channel=DummyChannel(id=10, name="general"),
-    )
+    # Only the author is populated: the bot-author check must run before any
+    # other message attribute is read.
+    event = SimpleNamespace(message=SimpleNamespace(author=SimpleNamespace(bot=True)))
 
-    await bot._on_message(DummyMessageCreateEvent(message=message))
+    await bot._on_message(event)
 
-    assert plugin.message_calls == 0
-    assert message.reply_calls == []
+    plugin.on_message.assert_not_awaited()
+    assert bot.state.channels == {}
+    assert bot.state.users == {}
 
 
-@pytest.mark.asyncio
-async def test_bot_routes_to_first_matching_handler_and_replies() -> None:
+async def test_bot_routes_to_first_matching_handler_and_replies(bot_config: BotConfig) -> None:
     plugin = _PluginProbe()
-    client = DummyClient(user=DummyUser(id=999, username="Bot", bot=True))
+    client = make_client()
 
     handler = EchoHandler(config=EchoConfig(prefix="echo:"))
-    bot = Bot(config=_config(), client=client, handlers=[handler], plugins=[plugin])
+    bot = Bot(config=bot_config, client=client, handlers=[handler], plugins=[plugin])
 
     message = DummyMessage(
         id=100,
@@ -158,10 +115,45 @@ async def test_bot_routes_to_first_matching_handler_and_replies() -> None:
 
     await bot._on_message(DummyMessageCreateEvent(message=message))
 
-    assert plugin.message_calls == 1
+    plugin.on_message.assert_awaited_once()
     assert message.reply_calls == ["hello world"]
 
     # State should include the inbound message and the bot reply.
-    messages = list(bot.state.messages.values())
-    assert any(m.content == "echo: hello world" for m in messages)
-    assert any(m.content == "hello world" for m in messages)
+    assert bot.state.messages[100].content == "echo: hello world"
+    assert bot.state.messages[1100].content == "hello world"
+
+
+async def test_bot_matching_handler_with_none_response_stops_routing(bot_config: BotConfig) -> None:
+    client = make_client()
+    bot = Bot(config=bot_config, client=client, handlers=[LoggingHandler(), EchoHandler()])
+
+    message = DummyMessage(
+        id=100,
+        content="echo: hello world",
+        author=DummyUser(id=2, username="Alice"),
+        channel=DummyChannel(id=10, name="general"),
+    )
+
+    await bot._on_message(DummyMessageCreateEvent(message=message))
+
+    # LoggingHandler matches first and returns None: no reply, no fallthrough.
+    assert message.reply_calls == []
+    assert 1100 not in bot.state.messages
+
+
+async def test_bot_user_recorded_once_across_replies(bot_config: BotConfig) -> None:
+    bot = Bot(config=bot_config, client=make_client(), handlers=[EchoHandler()])
+    channel = DummyChannel(id=10, name="general")
+    author = DummyUser(id=2, username="Alice")
+
+    await bot._on_message(
+        DummyMessageCreateEvent(message=DummyMessage(id=100, content="echo: one", author=author, channel=channel))
+    )
+    first = bot.state.users[BOT_USER.id]
+
+    await bot._on_message(
+        DummyMessageCreateEvent(message=DummyMessage(id=200, content="echo: two", author=author, channel=channel))
+    )
+
+    assert bot.state.users[BOT_USER.id] is first
+    assert bot.state.messages[1200].author_id == BOT_USER.id
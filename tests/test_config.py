@@ -1,10 +1,12 @@
 # tests/test_config.py
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import pytest
 from pydantic import SecretStr, ValidationError
 
-from discordia.config import BotConfig
+from discordia.config import BotConfig, get_config
 
 
 def test_bot_config_valid() -> None:
@@ -49,3 +51,26 @@ def test_bot_config_frozen() -> None:
     config = BotConfig(discord_token=SecretStr("test_token"), server_id=123456789)
     with pytest.raises(ValidationError):
         config.server_id = 999  # type: ignore[misc]
+
+
+@pytest.fixture
+def clear_config_cache() -> Iterator[None]:
+    """Isolate tests from the process-wide get_config() cache."""
+
+    get_config.cache_clear()
+    yield
+    get_config.cache_clear()
+
+
+def test_get_config_loads_once(monkeypatch: pytest.MonkeyPatch, clear_config_cache: None) -> None:
+    monkeypatch.setenv("DISCORDIA_DISCORD_TOKEN", "env_token")
+    monkeypatch.setenv("DISCORDIA_SERVER_ID", "42")
+
+    config = get_config()
+    assert config.server_id == 42
+    assert get_config() is config
+
+    monkeypatch.setenv("DISCORDIA_SERVER_ID", "43")
+    assert get_config() is config
+    get_config.cache_clear()
+    assert get_config().server_id == 43
@@ -2,111 +2,116 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
 
 import pytest
+from dummies import FIXED_NOW, ContextFactory
+from pydantic import ValidationError
 
-from discordia.context import MessageContext
 from discordia.state import Channel, MemoryState, Message, User
 
 
-def create_context(content: str, **kwargs: object) -> MessageContext:
-    state = MemoryState()
-    user = User(id=111, username="Alice")
-    channel = Channel(id=789, name="general", server_id=456)
-
-    timestamp = kwargs.pop("timestamp", datetime.now(UTC))
-
-    return MessageContext(
-        message_id=999,
-        content=content,
-        author=user,
-        channel=channel,
-        store=state,
-        timestamp=timestamp,
-        **kwargs,
-    )
-
-
-def test_is_command_true() -> None:
-    ctx = create_context("!ping")
+def test_is_command_true(make_ctx: ContextFactory) -> None:
+    ctx = make_ctx("!ping")
     assert ctx.is_command is True
 
 
-def test_is_command_false() -> None:
-    ctx = create_context("Hello world")
+def test_is_command_false(make_ctx: ContextFactory) -> None:
+    ctx = make_ctx("Hello world")
     assert ctx.is_command is False
 
 
-def test_command_parts() -> None:
-    ctx = create_context("!echo hello world")
+def test_command_parts(make_ctx: ContextFactory) -> None:
+    ctx = make_ctx("!echo hello world")
     assert ctx.command_parts == ["!echo", "hello", "world"]
 
 
-def test_command_name() -> None:
-    ctx = create_context("!ping")
+def test_command_parts_follow_copied_content(make_ctx: ContextFactory) -> None:
+    ctx = make_ctx("!a b")
+    assert ctx.command_parts == ["!a", "b"]
+    assert ctx.model_copy(update={"content": "!x y z"}).command_parts == ["!x", "y", "z"]
+
+
+def test_command_name(make_ctx: ContextFactory) -> None:
+    ctx = make_ctx("!ping")
     assert ctx.command_name == "ping"
 
 
-def test_command_name_none() -> None:
-    ctx = create_context("Hello")
+def test_command_name_none(make_ctx: ContextFactory) -> None:
+    ctx = make_ctx("Hello")
     assert ctx.command_name is None
 
 
-def test_command_args() -> None:
-    ctx = create_context("!echo hello world")
+def test_command_args(make_ctx: ContextFactory) -> None:
+    ctx = make_ctx("!echo hello world")
     assert ctx.command_args == ["hello", "world"]
 
 
-def test_command_args_empty() -> None:
-    ctx = create_context("!ping")
+def test_command_args_empty(make_ctx: ContextFactory) -> None:
+    ctx = make_ctx("!ping")
     assert ctx.command_args == []
 
 
-def test_age_ms() -> None:
+def test_age_ms(make_ctx: ContextFactory) -> None:
     past = datetime.now(UTC) - timedelta(seconds=2)
-    ctx = create_context("test", timestamp=past)
+    ctx = make_ctx("test", timestamp=past)
     assert ctx.age_ms >= 2000
 
 
-def test_mentions_bot_true() -> None:
-    ctx = create_context("Hey <@123> check this")
+def test_mentions_bot_true(make_ctx: ContextFactory) -> None:
+    ctx = make_ctx("Hey <@123> check this")
     assert ctx.mentions_bot is True
 
 
-def test_mentions_bot_false() -> None:
-    ctx = create_context("Hello world")
+def test_mentions_bot_false(make_ctx: ContextFactory) -> None:
+    ctx = make_ctx("Hello world")
     assert ctx.mentions_bot is False
 
 
-@pytest.mark.asyncio
-async def test_get_history() -> None:
-    state = MemoryState()
+def test_context_is_frozen(make_ctx: ContextFactory) -> None:
+    ctx = make_ctx("Hello")
+    with pytest.raises(ValidationError):
+        ctx.content = "changed"  # type: ignore[misc]
+
 
-    user = User(id=111, username="Alice")
-    await state.save_user(user)
+def test_context_accepts_mocked_store(make_ctx: ContextFactory) -> None:
+    store = AsyncMock(spec=MemoryState)
+    assert make_ctx("Hello", store=store).store is store
 
-    channel = Channel(id=789, name="general", server_id=456)
-    await state.save_channel(channel)
 
-    now = datetime.now(UTC)
-    for i in range(5):
-        msg = Message(
+def test_context_rejects_non_store(make_ctx: ContextFactory) -> None:
+    with pytest.raises(ValidationError) as exc_info:
+        make_ctx("Hello", store=object())
+    assert exc_info.value.errors()[0]["type"] == "is_instance_of"
+
+
+@pytest.fixture(scope="module")
+async def populated_state() -> MemoryState:
+    """A store seeded once per module with a user, a channel, and five messages.
+
+    Only read-only tests should consume this fixture; tests that mutate state
+    should build their own :class:`MemoryState`.
+    """
+
+    state = MemoryState()
+    await state.save_user(User(id=111, username="Alice"))
+    await state.save_channel(Channel(id=789, name="general", server_id=456))
+
+    await state.save_messages(
+        Message.model_construct(
             id=1000 + i,
             content=f"Msg {i}",
             author_id=111,
             channel_id=789,
-            timestamp=now + timedelta(milliseconds=i),
+            timestamp=FIXED_NOW + timedelta(milliseconds=i),
         )
-        await state.save_message(msg)
-
-    ctx = MessageContext(
-        message_id=1005,
-        content="current",
-        author=user,
-        channel=channel,
-        store=state,
-        timestamp=datetime.now(UTC),
+        for i in range(5)
     )
+    return state
+
+
+async def test_get_history(make_ctx: ContextFactory, populated_state: MemoryState) -> None:
+    ctx = make_ctx("current", store=populated_state)
 
     history = await ctx.get_history(limit=3)
     assert len(history) == 3
@@ -4,95 +4,96 @@ from __future__ import annotations
 from unittest.mock import Mock
 
 import pytest
+from dummies import DummyGuild
 
 from discordia.discovery import DiscoveryEngine, GuildCategory, GuildText
 from discordia.exceptions import DiscordAPIError
 from discordia.state import Category, MemoryState
 
+_GENERAL = Category(id=123, name="General", server_id=456)
+
 
 def create_mock_category(channel_id: int, name: str, position: int = 0) -> Mock:
     """Create a mock Discord category channel."""
 
-    cat = Mock()
-    cat.id = channel_id
-    cat.name = name
-    cat.position = position
-    cat.__class__ = GuildCategory
+    cat = Mock(spec=GuildCategory)
+    cat.configure_mock(id=channel_id, name=name, position=position)
     return cat
 
 
 def create_mock_text_channel(channel_id: int, name: str, parent_id: int | None = None) -> Mock:
     """Create a mock Discord text channel."""
 
-    ch = Mock()
-    ch.id = channel_id
-    ch.name = name
-    ch.parent_id = parent_id
-    ch.position = 0
-    ch.topic = None
-    ch.__class__ = GuildText
+    ch = Mock(spec=GuildText)
+    ch.configure_mock(id=channel_id, name=name, parent_id=parent_id, position=0, topic=None)
     return ch
 
 
-@pytest.mark.asyncio
 async def test_discover_categories_saves_to_store() -> None:
     state = MemoryState()
     engine = DiscoveryEngine(state, server_id=456)
 
-    guild = Mock()
-    guild.channels = [create_mock_category(123, "General")]
+    guild = DummyGuild([create_mock_category(123, "General"), create_mock_category(124, "Archive", position=1)])
 
     categories = await engine.discover_categories(guild)
 
-    assert len(categories) == 1
-    assert categories[0].id == 123
+    assert [c.id for c in categories] == [123, 124]
     assert categories[0].name == "General"
 
     saved = await state.get_category(123)
     assert saved is not None
     assert saved.name == "General"
+    assert await state.get_category(124) is not None
 
 
-@pytest.mark.asyncio
-async def test_discover_channels_saves_to_store() -> None:
+@pytest.mark.parametrize(
+    ("parent_id", "expected_category_id"),
+    [
+        (None, None),
+        (123, 123),
+    ],
+)
+async def test_discover_channels_saves_to_store(parent_id: int | None, expected_category_id: int | None) -> None:
     state = MemoryState()
     engine = DiscoveryEngine(state, server_id=456)
 
-    guild = Mock()
-    guild.channels = [create_mock_text_channel(789, "general")]
+    await state.save_category(_GENERAL)
+
+    guild = DummyGuild([create_mock_text_channel(789, "general", parent_id=parent_id)])
 
     channels = await engine.discover_channels(guild)
 
     assert len(channels) == 1
     assert channels[0].id == 789
     assert channels[0].name == "general"
+    assert channels[0].category_id == expected_category_id
 
     saved = await state.get_channel(789)
     assert saved is not None
 
 
-@pytest.mark.asyncio
-async def test_discover_channels_with_category_requires_existing_category() -> None:
+async def test_discovery_wraps_errors_in_discord_api_error() -> None:
     state = MemoryState()
     engine = DiscoveryEngine(state, server_id=456)
 
-    await state.save_category(Category(id=123, name="General", server_id=456))
-
-    guild = Mock()
-    guild.channels = [create_mock_text_channel(789, "general", parent_id=123)]
+    # A text channel with a missing category triggers a StateError from the store, which should be wrapped.
+    guild = DummyGuild([create_mock_text_channel(789, "general", parent_id=999)])
 
-    channels = await engine.discover_channels(guild)
-    assert channels[0].category_id == 123
+    with pytest.raises(DiscordAPIError):
+        await engine.discover_channels(guild)
 
 
-@pytest.mark.asyncio
-async def test_discovery_wraps_errors_in_discord_api_error() -> None:
+async def test_discovery_stops_at_first_failed_save() -> None:
     state = MemoryState()
     engine = DiscoveryEngine(state, server_id=456)
 
-    # A text channel with a missing category triggers a StateError from the store, which should be wrapped.
-    guild = Mock()
-    guild.channels = [create_mock_text_channel(789, "general", parent_id=999)]
+    guild = DummyGuild(
+        [
+            create_mock_text_channel(789, "orphan", parent_id=999),
+            create_mock_text_channel(790, "general"),
+        ]
+    )
 
     with pytest.raises(DiscordAPIError):
         await engine.discover_channels(guild)
+    assert await state.get_channel(790) is None
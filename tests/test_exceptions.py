@@ -1,30 +1,66 @@
 # tests/test_exceptions.py
 from __future__ import annotations
 
-from discordia.exceptions import ConfigurationError, DiscordiaError, StateError
+import pytest
 
+from discordia import exceptions
+from discordia.exceptions import (
+    ConfigurationError,
+    DiscordAPIError,
+    DiscordiaError,
+    EntityNotFoundError,
+    StateError,
+    ValidationError,
+)
 
-def test_base_exception() -> None:
-    err = DiscordiaError("test error")
+_ALL_DISCORDIA_EXCEPTIONS: tuple[type[DiscordiaError], ...] = (
+    DiscordiaError,
+    ConfigurationError,
+    StateError,
+    DiscordAPIError,
+    EntityNotFoundError,
+    ValidationError,
+)
+_ALL_DISCORDIA_EXCEPTION_SET: frozenset[type[DiscordiaError]] = frozenset(_ALL_DISCORDIA_EXCEPTIONS)
+
+
+def test_exception_tuple_covers_public_exports() -> None:
+    exported = {getattr(exceptions, name) for name in exceptions.__all__}
+    assert exported == _ALL_DISCORDIA_EXCEPTION_SET
+
+
+@pytest.mark.parametrize("exc_type", _ALL_DISCORDIA_EXCEPTIONS, ids=lambda c: c.__name__)
+def test_base_exception(exc_type: type[DiscordiaError]) -> None:
+    err = exc_type("test error")
     assert str(err) == "test error"
     assert err.message == "test error"
     assert err.cause is None
 
 
-def test_exception_with_cause() -> None:
+@pytest.mark.parametrize("exc_type", _ALL_DISCORDIA_EXCEPTIONS, ids=lambda c: c.__name__)
+def test_exception_with_cause(exc_type: type[DiscordiaError]) -> None:
     cause = ValueError("original error")
-    err = DiscordiaError("wrapper error", cause=cause)
+    err = exc_type("wrapper error", cause=cause)
     assert "caused by" in str(err)
     assert err.cause is cause
 
 
-def test_exception_hierarchy() -> None:
-    assert issubclass(ConfigurationError, DiscordiaError)
-    assert issubclass(StateError, DiscordiaError)
+@pytest.mark.parametrize(
+    ("exc_class", "parent"),
+    [
+        (ConfigurationError, DiscordiaError),
+        (StateError, DiscordiaError),
+        (DiscordAPIError, DiscordiaError),
+        (EntityNotFoundError, StateError),
+        (ValidationError, DiscordiaError),
+    ],
+)
+def test_exception_hierarchy(exc_class: type[DiscordiaError], parent: type[DiscordiaError]) -> None:
+    assert issubclass(exc_class, parent)
 
 
-def test_exception_raising() -> None:
-    try:
-        raise ConfigurationError("bad config")
-    except DiscordiaError as e:
-        assert e.message == "bad config"
+@pytest.mark.parametrize("exc_type", _ALL_DISCORDIA_EXCEPTIONS, ids=lambda c: c.__name__)
+def test_exception_raising(exc_type: type[DiscordiaError]) -> None:
+    with pytest.raises(DiscordiaError) as exc_info:
+        raise exc_type("bad config")
+    assert exc_info.value.message == "bad config"
@@ -1,74 +1,52 @@
 # tests/test_handlers.py
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from dummies import ContextFactory
 
-import pytest
-
-from discordia.context import MessageContext
 from discordia.handlers import EchoConfig, EchoHandler, LoggingConfig, LoggingHandler
-from discordia.state import Channel, MemoryState, User
-
-
-def create_context(content: str) -> MessageContext:
-    return MessageContext(
-        message_id=999,
-        content=content,
-        author=User(id=111, username="Alice"),
-        channel=Channel(id=789, name="general", server_id=456),
-        store=MemoryState(),
-        timestamp=datetime.now(UTC),
-    )
 
 
-@pytest.mark.asyncio
-async def test_logging_handler_can_handle() -> None:
+async def test_logging_handler_can_handle(make_ctx: ContextFactory) -> None:
     handler = LoggingHandler()
-    ctx = create_context("test")
+    ctx = make_ctx("test")
     assert await handler.can_handle(ctx) is True
 
 
-@pytest.mark.asyncio
-async def test_logging_handler_disabled() -> None:
+async def test_logging_handler_disabled(make_ctx: ContextFactory) -> None:
     handler = LoggingHandler(config=LoggingConfig(enabled=False))
-    ctx = create_context("test")
+    ctx = make_ctx("test")
     assert await handler.can_handle(ctx) is False
 
 
-@pytest.mark.asyncio
-async def test_logging_handler_returns_none() -> None:
+async def test_logging_handler_returns_none(make_ctx: ContextFactory) -> None:
     handler = LoggingHandler()
-    ctx = create_context("test")
+    ctx = make_ctx("test")
     response = await handler.handle(ctx)
     assert response is None
 
 
-@pytest.mark.asyncio
-async def test_echo_handler_matches() -> None:
+async def test_echo_handler_matches(make_ctx: ContextFactory) -> None:
     handler = EchoHandler()
-    ctx = create_context("echo:hello world")
+    ctx = make_ctx("echo:hello world")
     assert await handler.can_handle(ctx) is True
 
 
-@pytest.mark.asyncio
-async def test_echo_handler_no_match() -> None:
+async def test_echo_handler_no_match(make_ctx: ContextFactory) -> None:
     handler = EchoHandler()
-    ctx = create_context("hello world")
+    ctx = make_ctx("hello world")
     assert await handler.can_handle(ctx) is False
 
 
-@pytest.mark.asyncio
-async def test_echo_handler_response() -> None:
+async def test_echo_handler_response(make_ctx: ContextFactory) -> None:
     handler = EchoHandler()
-    ctx = create_context("echo:hello world")
+    ctx = make_ctx("echo:hello world")
     response = await handler.handle(ctx)
     assert response == "hello world"
 
 
-@pytest.mark.asyncio
-async def test_echo_handler_custom_prefix() -> None:
+async def test_echo_handler_custom_prefix(make_ctx: ContextFactory) -> None:
     handler = EchoHandler(config=EchoConfig(prefix="repeat:"))
-    ctx = create_context("repeat:test")
+    ctx = make_ctx("repeat:test")
     assert await handler.can_handle(ctx) is True
     response = await handler.handle(ctx)
     assert response == "test"
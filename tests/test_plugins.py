@@ -1,9 +1,7 @@
 # tests/test_plugins.py
 from __future__ import annotations
 
-from datetime import UTC, datetime
-
-import pytest
+from dummies import FIXED_NOW
 
 from discordia.context import MessageContext
 from discordia.plugins import Plugin
@@ -13,6 +11,8 @@ from discordia.state import Channel, MemoryState, User
 class ExamplePlugin:
     """Test plugin implementation."""
 
+    __slots__ = ("ready_called", "message_count")
+
     def __init__(self) -> None:
         self.ready_called = False
         self.message_count = 0
@@ -24,14 +24,12 @@ class ExamplePlugin:
         self.message_count += 1
 
 
-@pytest.mark.asyncio
 async def test_plugin_on_ready() -> None:
     plugin = ExamplePlugin()
     await plugin.on_ready(None, None)
     assert plugin.ready_called is True
 
 
-@pytest.mark.asyncio
 async def test_plugin_on_message() -> None:
     plugin = ExamplePlugin()
     ctx = MessageContext(
@@ -40,7 +38,7 @@ async def test_plugin_on_message() -> None:
         author=User(id=111, username="Alice"),
         channel=Channel(id=789, name="general", server_id=456),
         store=MemoryState(),
-        timestamp=datetime.now(tz=UTC),
+        timestamp=FIXED_NOW,
     )
     await plugin.on_message(None, ctx)
     assert plugin.message_count == 1
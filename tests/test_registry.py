@@ -7,63 +7,95 @@ from discordia.exceptions import EntityNotFoundError
 from discordia.registry import EntityRegistry
 from discordia.state import Category, Channel, MemoryState
 
+# Registry lookups never exercise model validation, so fixtures are built with
+# ``model_construct`` to skip it; validation is covered in test_state/test_types.
 
-@pytest.mark.asyncio
-async def test_get_category_by_name() -> None:
+
+@pytest.mark.parametrize(("name", "found"), [("General", True), ("Missing", False)])
+async def test_get_category_by_name(name: str, found: bool) -> None:
     state = MemoryState()
     registry = EntityRegistry(state)
 
-    cat = Category(id=123, name="General", server_id=456)
+    cat = Category.model_construct(id=123, name="General", server_id=456)
     await state.save_category(cat)
 
-    found = await registry.get_category_by_name("General", 456)
-    assert found == cat
+    if not found:
+        with pytest.raises(EntityNotFoundError):
+            await registry.get_category_by_name(name, 456)
+        return
 
+    assert await registry.get_category_by_name(name, 456) == cat
 
-@pytest.mark.asyncio
-async def test_get_category_by_name_not_found() -> None:
+
+@pytest.mark.parametrize(("name", "found"), [("general", True), ("missing", False)])
+async def test_get_channel_by_name(name: str, found: bool) -> None:
     state = MemoryState()
     registry = EntityRegistry(state)
 
-    with pytest.raises(EntityNotFoundError):
-        await registry.get_category_by_name("Missing", 456)
+    ch = Channel.model_construct(id=789, name="general", server_id=456)
+    await state.save_channel(ch)
+
+    if not found:
+        with pytest.raises(EntityNotFoundError):
+            await registry.get_channel_by_name(name, 456)
+        return
 
+    assert await registry.get_channel_by_name(name, 456) == ch
 
-@pytest.mark.asyncio
-async def test_get_channel_by_name() -> None:
+
+async def test_get_channels_in_category() -> None:
     state = MemoryState()
     registry = EntityRegistry(state)
 
-    ch = Channel(id=789, name="general", server_id=456)
-    await state.save_channel(ch)
+    cat = Category.model_construct(id=123, name="General", server_id=456)
+    await state.save_category(cat)
 
-    found = await registry.get_channel_by_name("general", 456)
-    assert found == ch
+    ch1 = Channel.model_construct(id=789, name="general", server_id=456, category_id=123)
+    ch2 = Channel.model_construct(id=790, name="random", server_id=456, category_id=123)
+    await state.save_channel(ch1)
+    await state.save_channel(ch2)
+
+    channels = await registry.get_channels_in_category(123)
+    assert len(channels) == 2
+    assert ch1 in channels
+    assert ch2 in channels
 
 
-@pytest.mark.asyncio
-async def test_get_channel_by_name_not_found() -> None:
+async def test_lookups_follow_renamed_and_moved_channels() -> None:
     state = MemoryState()
     registry = EntityRegistry(state)
 
+    await state.save_category(Category.model_construct(id=123, name="General", server_id=456))
+    await state.save_category(Category.model_construct(id=124, name="Archive", server_id=456))
+    await state.save_channel(Channel.model_construct(id=789, name="general", server_id=456, category_id=123))
+
+    moved = Channel.model_construct(id=789, name="old-general", server_id=456, category_id=124)
+    await state.save_channel(moved)
+
     with pytest.raises(EntityNotFoundError):
-        await registry.get_channel_by_name("missing", 456)
+        await registry.get_channel_by_name("general", 456)
+    assert await registry.get_channel_by_name("old-general", 456) == moved
+    assert await registry.get_channels_in_category(123) == []
+    assert await registry.get_channels_in_category(124) == [moved]
 
 
-@pytest.mark.asyncio
-async def test_get_channels_in_category() -> None:
+async def test_lookups_follow_in_place_changes() -> None:
     state = MemoryState()
     registry = EntityRegistry(state)
 
     cat = Category(id=123, name="General", server_id=456)
     await state.save_category(cat)
+    await state.save_category(Category(id=124, name="Archive", server_id=456))
+    ch = Channel(id=789, name="general", server_id=456, category_id=123)
+    await state.save_channel(ch)
 
-    ch1 = Channel(id=789, name="general", server_id=456, category_id=123)
-    ch2 = Channel(id=790, name="random", server_id=456, category_id=123)
-    await state.save_channel(ch1)
-    await state.save_channel(ch2)
+    cat.name = "Renamed"
+    await state.save_category(cat)
+    ch.category_id = 124
+    await state.save_channel(ch)
 
-    channels = await registry.get_channels_in_category(123)
-    assert len(channels) == 2
-    assert ch1 in channels
-    assert ch2 in channels
+    with pytest.raises(EntityNotFoundError):
+        await registry.get_category_by_name("General", 456)
+    assert await registry.get_category_by_name("Renamed", 456) is cat
+    assert await registry.get_channels_in_category(123) == []
+    assert await registry.get_channels_in_category(124) == [ch]
@@ -4,41 +4,42 @@ from __future__ import annotations
 from datetime import UTC, datetime, timedelta
 
 import pytest
+from dummies import FIXED_NOW
 
 from discordia.exceptions import StateError
-from discordia.state import Category, Channel, MemoryState, Message, User
+from discordia.state import Category, Channel, MemoryState, Message, StateStore, User
 
+# Seed entities shared by the store tests; models are never mutated.
+_CATEGORY = Category(id=123, name="General", server_id=456)
+_AUTHOR = User(id=111, username="Alice")
+_CHANNEL = Channel(id=789, name="general", server_id=456)
 
-@pytest.mark.asyncio
-async def test_category_creation() -> None:
+
+def test_category_creation() -> None:
     cat = Category(id=123, name="General", server_id=456)
     assert cat.id == 123
     assert cat.name == "General"
     assert cat.position == 0
 
 
-@pytest.mark.asyncio
-async def test_channel_creation() -> None:
+def test_channel_creation() -> None:
     ch = Channel(id=789, name="general", server_id=456)
     assert ch.name == "general"
     assert ch.is_categorized is False
 
 
-@pytest.mark.asyncio
-async def test_channel_with_category() -> None:
+def test_channel_with_category() -> None:
     ch = Channel(id=789, name="general", server_id=456, category_id=123)
     assert ch.is_categorized is True
 
 
-@pytest.mark.asyncio
-async def test_user_creation() -> None:
+def test_user_creation() -> None:
     user = User(id=111, username="Alice")
     assert user.username == "Alice"
     assert user.bot is False
 
 
-@pytest.mark.asyncio
-async def test_message_computed_fields() -> None:
+def test_message_computed_fields() -> None:
     msg = Message(
         id=999,
         content="Hello",
@@ -50,35 +51,39 @@ async def test_message_computed_fields() -> None:
     assert msg.is_edited is False
 
 
-@pytest.mark.asyncio
-async def test_message_edited() -> None:
+def test_message_edited() -> None:
     msg = Message(
         id=999,
         content="Hello",
         author_id=111,
         channel_id=789,
-        timestamp=datetime.now(UTC),
-        edited_at=datetime.now(UTC),
+        timestamp=FIXED_NOW,
+        edited_at=FIXED_NOW,
     )
     assert msg.is_edited is True
 
 
-@pytest.mark.asyncio
+@pytest.fixture
+async def seeded_state() -> MemoryState:
+    """A fresh store holding the shared author and channel."""
+    state = MemoryState()
+    await state.save_user(_AUTHOR)
+    await state.save_channel(_CHANNEL)
+    return state
+
+
 async def test_memory_state_save_category() -> None:
     state = MemoryState()
-    cat = Category(id=123, name="General", server_id=456)
 
-    await state.save_category(cat)
+    await state.save_category(_CATEGORY)
     retrieved = await state.get_category(123)
 
-    assert retrieved == cat
+    assert retrieved == _CATEGORY
 
 
-@pytest.mark.asyncio
 async def test_memory_state_save_channel() -> None:
     state = MemoryState()
-    cat = Category(id=123, name="General", server_id=456)
-    await state.save_category(cat)
+    await state.save_category(_CATEGORY)
 
     ch = Channel(id=789, name="general", server_id=456, category_id=123)
     await state.save_channel(ch)
@@ -87,7 +92,6 @@ async def test_memory_state_save_channel() -> None:
     assert retrieved == ch
 
 
-@pytest.mark.asyncio
 async def test_memory_state_channel_invalid_category() -> None:
     state = MemoryState()
     ch = Channel(id=789, name="general", server_id=456, category_id=999)
@@ -96,7 +100,6 @@ async def test_memory_state_channel_invalid_category() -> None:
         await state.save_channel(ch)
 
 
-@pytest.mark.asyncio
 async def test_memory_state_message_validation() -> None:
     state = MemoryState()
     msg = Message(
@@ -104,55 +107,152 @@ async def test_memory_state_message_validation() -> None:
         content="Hello",
         author_id=111,
         channel_id=789,
-        timestamp=datetime.now(UTC),
+        timestamp=FIXED_NOW,
     )
 
     with pytest.raises(StateError):
         await state.save_message(msg)
 
-    user = User(id=111, username="Alice")
-    await state.save_user(user)
+    await state.save_user(_AUTHOR)
 
     with pytest.raises(StateError):
         await state.save_message(msg)
 
-    ch = Channel(id=789, name="general", server_id=456)
-    await state.save_channel(ch)
+    await state.save_channel(_CHANNEL)
 
     await state.save_message(msg)
     retrieved = await state.get_message(999)
     assert retrieved == msg
 
 
-@pytest.mark.asyncio
-async def test_memory_state_get_messages() -> None:
-    state = MemoryState()
-
-    user = User(id=111, username="Alice")
-    await state.save_user(user)
-    ch = Channel(id=789, name="general", server_id=456)
-    await state.save_channel(ch)
-
-    now = datetime.now(UTC)
-    for i in range(5):
-        msg = Message(
+async def test_memory_state_get_messages(seeded_state: MemoryState) -> None:
+    msgs = [
+        Message.model_construct(
             id=1000 + i,
             content=f"Message {i}",
             author_id=111,
             channel_id=789,
-            timestamp=now + timedelta(milliseconds=i),
+            timestamp=FIXED_NOW + timedelta(milliseconds=i),
         )
-        await state.save_message(msg)
+        for i in range(5)
+    ]
+    await seeded_state.save_messages(reversed(msgs))
 
-    messages = await state.get_messages(789, limit=3)
+    messages = await seeded_state.get_messages(789, limit=3)
     assert len(messages) == 3
     assert messages[0].content == "Message 2"
 
 
-@pytest.mark.asyncio
-async def test_state_entity_timestamp_update() -> None:
+async def test_memory_state_save_messages_is_all_or_nothing(seeded_state: MemoryState) -> None:
+    good = Message.model_construct(id=1000, content="ok", author_id=111, channel_id=789, timestamp=FIXED_NOW)
+    orphan = Message.model_construct(id=1001, content="bad", author_id=222, channel_id=789, timestamp=FIXED_NOW)
+
+    with pytest.raises(StateError):
+        await seeded_state.save_messages([good, orphan])
+
+    assert await seeded_state.get_message(1000) is None
+    assert await seeded_state.get_messages(789) == []
+
+
+async def test_memory_state_get_messages_orders_out_of_order_and_resaved(seeded_state: MemoryState) -> None:
+    for i in (2, 0, 1):
+        await seeded_state.save_message(
+            Message.model_construct(
+                id=1000 + i,
+                content=f"Message {i}",
+                author_id=111,
+                channel_id=789,
+                timestamp=FIXED_NOW + timedelta(milliseconds=i),
+            )
+        )
+    edited = Message.model_construct(
+        id=1000,
+        content="Edited",
+        author_id=111,
+        channel_id=789,
+        timestamp=FIXED_NOW,
+        edited_at=FIXED_NOW,
+    )
+    await seeded_state.save_message(edited)
+
+    messages = await seeded_state.get_messages(789, limit=0)
+    assert [m.id for m in messages] == [1000, 1001, 1002]
+    assert messages[0] is edited
+
+
+async def test_memory_state_save_messages_resaves_mutated_instances(seeded_state: MemoryState) -> None:
+    msgs = [
+        Message(
+            id=100 + i,
+            content=f"Message {i}",
+            author_id=111,
+            channel_id=789,
+            timestamp=FIXED_NOW + timedelta(seconds=i),
+        )
+        for i in range(3)
+    ]
+    await seeded_state.save_messages(msgs)
+
+    msgs[0].timestamp = FIXED_NOW + timedelta(seconds=10)
+    msgs[2].timestamp = FIXED_NOW + timedelta(milliseconds=500)
+    await seeded_state.save_messages([msgs[0], msgs[2]])
+
+    assert [m.id for m in await seeded_state.get_messages(789, limit=0)] == [102, 101, 100]
+
+
+@pytest.mark.parametrize("offset", [timedelta(milliseconds=1500), timedelta(seconds=10)], ids=["middle", "end"])
+async def test_memory_state_resave_mutated_message(seeded_state: MemoryState, offset: timedelta) -> None:
+    msgs = [
+        Message(
+            id=100 + i,
+            content=f"Message {i}",
+            author_id=111,
+            channel_id=789,
+            timestamp=FIXED_NOW + timedelta(seconds=i),
+        )
+        for i in range(3)
+    ]
+    for msg in msgs:
+        await seeded_state.save_message(msg)
+
+    msgs[0].timestamp = FIXED_NOW + offset
+    await seeded_state.save_message(msgs[0])
+
+    expected = [101, 100, 102] if offset < timedelta(seconds=2) else [101, 102, 100]
+    assert [m.id for m in await seeded_state.get_messages(789, limit=0)] == expected
+
+
+def test_state_entity_timestamp_update() -> None:
     cat = Category(id=123, name="General", server_id=456)
     original_updated = cat.updated_at
 
-    cat = Category.model_validate(cat.model_dump() | {"name": "Updated"})
+    cat.name = "Updated"
+    assert cat.name == "Updated"
     assert cat.updated_at >= original_updated
+
+
+class _MinimalStore:
+    """Implements exactly the StateStore protocol and nothing else."""
+
+    async def save_category(self, category: Category) -> None: ...
+
+    async def save_channel(self, channel: Channel) -> None: ...
+
+    async def save_user(self, user: User) -> None: ...
+
+    async def save_message(self, message: Message) -> None: ...
+
+    async def get_category(self, id: int) -> Category | None: ...
+
+    async def get_channel(self, id: int) -> Channel | None: ...
+
+    async def get_user(self, id: int) -> User | None: ...
+
+    async def get_message(self, id: int) -> Message | None: ...
+
+    async def get_messages(self, channel_id: int, limit: int = 20) -> list[Message]: ...
+
+
+def test_custom_store_satisfies_protocol() -> None:
+    assert isinstance(_MinimalStore(), StateStore)
+    assert isinstance(MemoryState(), StateStore)
@@ -2,92 +2,80 @@
 from __future__ import annotations
 
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from discordia.types import ChannelName, DiscordID, MessageContent, Username
 
-
-class DiscordIdModel(BaseModel):
-    id: DiscordID
-
-
-def test_discord_id_valid() -> None:
-    model = DiscordIdModel(id=123456789)
-    assert model.id == 123456789
-
-
-def test_discord_id_negative() -> None:
-    with pytest.raises(ValidationError):
-        DiscordIdModel(id=-1)
-
-
-def test_discord_id_zero() -> None:
-    with pytest.raises(ValidationError):
-        DiscordIdModel(id=0)
-
-
-def test_discord_id_too_large() -> None:
-    with pytest.raises(ValidationError):
-        DiscordIdModel(id=2**63)
-
-
-class ChannelModel(BaseModel):
-    name: ChannelName
-
-
-def test_channel_name_valid() -> None:
-    assert ChannelModel(name="general").name == "general"
-    assert ChannelModel(name="test-channel").name == "test-channel"
-    assert ChannelModel(name="bot_commands").name == "bot_commands"
-
-
-def test_channel_name_uppercase() -> None:
-    # Uppercase now allowed for threads
-    assert ChannelModel(name="General").name == "General"
-
-
-def test_channel_name_with_spaces() -> None:
-    # Spaces now allowed for threads
-    assert ChannelModel(name="Thread Test").name == "Thread Test"
-
-
-def test_channel_name_special_chars() -> None:
-    with pytest.raises(ValidationError):
-        ChannelModel(name="channel#1")
-
-
-def test_channel_name_too_long() -> None:
-    with pytest.raises(ValidationError):
-        ChannelModel(name="a" * 101)
-
-
-class UsernameModel(BaseModel):
-    username: Username
-
-
-def test_username_valid() -> None:
-    assert UsernameModel(username="Alice").username == "Alice"
-
-
-def test_username_too_short() -> None:
-    with pytest.raises(ValidationError):
-        UsernameModel(username="a")
-
-
-def test_username_too_long() -> None:
-    with pytest.raises(ValidationError):
-        UsernameModel(username="a" * 33)
-
-
-class MessageModel(BaseModel):
-    content: MessageContent
-
-
-def test_message_content_valid() -> None:
-    msg = MessageModel(content="Hello world")
-    assert msg.content == "Hello world"
-
-
-def test_message_content_too_long() -> None:
-    with pytest.raises(ValidationError):
-        MessageModel(content="a" * 2001)
+pytestmark = pytest.mark.filterwarnings("error")
+
+# Validate the constrained types directly instead of through wrapper models.
+_DISCORD_ID = TypeAdapter(DiscordID)
+_CHANNEL_NAME = TypeAdapter(ChannelName)
+_USERNAME = TypeAdapter(Username)
+_MESSAGE_CONTENT = TypeAdapter(MessageContent)
+
+# One character past each documented maximum.
+_CHANNEL_NAME_TOO_LONG = "a" * 101
+_USERNAME_TOO_LONG = "a" * 33
+_MESSAGE_CONTENT_TOO_LONG = "a" * 2001
+
+
+@pytest.mark.parametrize(
+    ("value", "ok"),
+    [(123456789, True), (-1, False), (0, False), (2**63, False)],
+    ids=["valid", "negative", "zero", "too_large"],
+)
+def test_discord_id(value: int, ok: bool) -> None:
+    if not ok:
+        with pytest.raises(ValidationError):
+            _DISCORD_ID.validate_python(value)
+        return
+    assert _DISCORD_ID.validate_python(value) == value
+
+
+@pytest.mark.parametrize(
+    ("name", "ok"),
+    [
+        ("general", True),
+        ("test-channel", True),
+        ("bot_commands", True),
+        # Uppercase and spaces are allowed for threads
+        ("General", True),
+        ("Thread Test", True),
+        ("channel#1", False),
+        (_CHANNEL_NAME_TOO_LONG, False),
+    ],
+    ids=["plain", "hyphen", "underscore", "uppercase", "spaces", "special_chars", "too_long"],
+)
+def test_channel_name(name: str, ok: bool) -> None:
+    if not ok:
+        with pytest.raises(ValidationError):
+            _CHANNEL_NAME.validate_python(name)
+        return
+    assert _CHANNEL_NAME.validate_python(name) == name
+
+
+@pytest.mark.parametrize(
+    ("username", "ok"),
+    [("Alice", True), ("a", False), (_USERNAME_TOO_LONG, False)],
+    ids=["valid", "too_short", "too_long"],
+)
+def test_username(username: str, ok: bool) -> None:
+    if not ok:
+        with pytest.raises(ValidationError):
+            _USERNAME.validate_python(username)
+        return
+    assert _USERNAME.validate_python(username) == username
+
+
+@pytest.mark.parametrize(
+    ("content", "ok"),
+    [("Hello world", True), (_MESSAGE_CONTENT_TOO_LONG, False)],
+    ids=["valid", "too_long"],
+)
+def test_message_content(content: str, ok: bool) -> None:
+    if not ok:
+        with pytest.raises(ValidationError):
+            _MESSAGE_CONTENT.validate_python(content)
+        return
+    assert _MESSAGE_CONTENT.validate_python(content) == content